@@ -1,46 +1,141 @@
-import streamlit as st
-import pandas as pd
 import os
-from datetime import datetime
-
-# File to store data
-DATA_FILE = "shark_pups.csv"
-
-st.title("🦈 Shark Pup Tracker")
-st.write("Log and review data from your shark pups.")
-
-# Input form
-with st.form("pup_form"):
-    date = st.date_input("Date", value=datetime.today())
-    pup_id = st.text_input("Pup ID")
-    weight = st.number_input("Weight (g)", min_value=0.0, step=0.1)
-    length = st.number_input("Length (cm)", min_value=0.0, step=0.1)
-    notes = st.text_area("Notes", height=100)
-    submitted = st.form_submit_button("Add Entry")
-
-    if submitted:
-        new_row = {
-            "Date": date.strftime("%Y-%m-%d"),
-            "Pup ID": pup_id,
-            "Weight (g)": weight,
-            "Length (cm)": length,
-            "Notes": notes,
-        }
-
-        if os.path.exists(DATA_FILE):
-            df = pd.read_csv(DATA_FILE)
-            df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
-        else:
-            df = pd.DataFrame([new_row])
-
-        df.to_csv(DATA_FILE, index=False)
-        st.success(f"Saved entry for Pup ID: {pup_id}")
-
-# Show current records
-if os.path.exists(DATA_FILE):
-    st.subheader("📊 All Recorded Shark Pups")
-    df = pd.read_csv(DATA_FILE)
-    st.dataframe(df)
-else:
-    st.info("No data recorded yet.")
+import time
+import logging
 
+from functools import wraps
+
+from flask import Flask, Response, make_response, request
+from flask_sqlalchemy import SQLAlchemy
+from flask_login import LoginManager
+from werkzeug.middleware.proxy_fix import ProxyFix
+
+# Set up logging
+logging.basicConfig(level=logging.DEBUG)
+
+# Create the Flask app
+app = Flask(__name__)
+app.secret_key = os.environ.get("SESSION_SECRET", "shark-pup-tracker-secret")
+app.wsgi_app = ProxyFix(app.wsgi_app, x_proto=1, x_host=1)
+
+# Configure the database
+app.config["SQLALCHEMY_DATABASE_URI"] = os.environ.get("DATABASE_URL")
+app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+    "pool_pre_ping": True,
+    "pool_recycle": 300,
+    # Size the pool for the expected request concurrency instead of the
+    # SQLAlchemy defaults (5/10/30s), which cap throughput under load.
+    "pool_size": 20,
+    "max_overflow": 40,
+    "pool_timeout": 10,
+    # LIFO reuse keeps a small hot set of connections (and their DB-side
+    # caches) warm instead of cycling through the whole pool.
+    "pool_use_lifo": True,
+    # Bound tail latency on runaway queries
+    "connect_args": {"options": "-c statement_timeout=5000"},
+}
+
+# Let browsers cache static assets for an hour instead of re-fetching
+# them on every page view.
+app.config["SEND_FILE_MAX_AGE_DEFAULT"] = 3600
+
+db = SQLAlchemy(app)
+# The ORM maps only the users table (see models.SharkPupUser), which has
+# no relationships — pups and their records live in JSON files via
+# DataManager — so there is no lazy loading for an N+1 detector such as
+# nplusone to guard against.
+
+# Simple in-process response cache for read-only views. Werkzeug's old
+# contrib cache is gone from modern releases, so this is a plain dict
+# keyed on the request path and query string. Bounded like _user_cache
+# below: keys come from the query string, so without a cap arbitrary
+# ?foo= noise would grow the dict forever (expired entries are only
+# overwritten, never swept).
+_RESPONSE_CACHE_MAX = 1024
+_response_cache = {}
+
+def cached(timeout=60):
+    """Cache a read-only view's response for `timeout` seconds.
+
+    Entries hold a frozen (body, status, headers) snapshot, never a live
+    Response: hooks like make_conditional mutate Response objects in
+    place, so sharing one across requests would let a single 304
+    revalidation poison the entry for every later client. Each hit
+    builds a fresh Response from the snapshot instead.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            key = request.full_path
+            hit = _response_cache.get(key)
+            now = time.time()
+            if hit is not None and hit[0] > now:
+                body, status, headers = hit[1]
+                return Response(body, status=status, headers=headers)
+            response = make_response(view(*args, **kwargs))
+            snapshot = (response.get_data(), response.status_code,
+                        list(response.headers))
+            if len(_response_cache) >= _RESPONSE_CACHE_MAX:
+                _response_cache.clear()
+            _response_cache[key] = (now + timeout, snapshot)
+            return response
+        return wrapper
+    return decorator
+
+def clear_response_cache():
+    """Invalidate all cached view responses after a write."""
+    _response_cache.clear()
+
+@app.after_request
+def add_conditional_headers(response):
+    """Attach an ETag to API/export responses and honor If-None-Match.
+
+    Clients (and any CDN in front) get a 304 with no body when their
+    cached copy still matches, skipping the transfer entirely. Streamed
+    responses are left alone — reading their body here would buffer the
+    whole export and defeat the streaming.
+    """
+    path = request.path
+    if (response.status_code == 200
+            and not response.direct_passthrough
+            and not response.is_streamed
+            and (path.startswith('/api/') or path.startswith('/export/'))):
+        response.add_etag()
+        response.make_conditional(request)
+    return response
+
+# Set up login manager
+login_manager = LoginManager()
+login_manager.init_app(app)
+login_manager.login_view = 'login'
+login_manager.login_message = 'Please log in to access this page.'
+login_manager.login_message_category = 'info'
+
+# Short-TTL cache for load_user: it runs on every authenticated request
+# and user rows rarely change within a session, so the common case should
+# not cost a SQL round-trip.
+_USER_CACHE_TTL = 30  # seconds
+_USER_CACHE_MAX = 4096
+_user_cache = {}
+
+@login_manager.user_loader
+def load_user(user_id):
+    """Load a user for Flask-Login, caching lookups for a short TTL."""
+    cached = _user_cache.get(user_id)
+    if cached is not None and cached[0] > time.time():
+        return cached[1]
+    from models import SharkPupUser
+    # Session.get short-circuits on identity-map hits and avoids the
+    # deprecated Query.get API entirely.
+    user = db.session.get(SharkPupUser, int(user_id))
+    if len(_user_cache) >= _USER_CACHE_MAX:
+        _user_cache.clear()
+    _user_cache[user_id] = (time.time() + _USER_CACHE_TTL, user)
+    return user
+
+def invalidate_user_cache(user_id=None):
+    """Drop a cached user (or all of them) after a profile change."""
+    if user_id is None:
+        _user_cache.clear()
+    else:
+        _user_cache.pop(user_id, None)
@@ -1,12 +1,43 @@
 import os
 import json
 import logging
-from datetime import datetime
+import mmap
+from collections import defaultdict
+from datetime import date
+from functools import lru_cache
+from operator import attrgetter
+
+try:
+    import orjson
+except ImportError:
+    # Optional accelerator for both directions of the file round-trip
+    # (loads in _parse_file, dumps in _save/_dump_record); stdlib json
+    # handles everything when it isn't installed.
+    orjson = None
 from models import SharkPup, FeedingRecord, TrainingRecord, FeedingSession, FoodItem, MeasurementRecord
 
+@lru_cache(maxsize=4096)
+def _days_between(first, last):
+    """Days between two strict YYYY-MM-DD strings.
+
+    Fixed-slice int() construction skips ISO parsing entirely, and the
+    same endpoint pairs recur across pups and repeated stats calls, so
+    after warm-up a call is one cache hit.
+    """
+    return (date(int(last[:4]), int(last[5:7]), int(last[8:10]))
+            - date(int(first[:4]), int(first[5:7]), int(first[8:10]))).days
+
 class DataManager:
-    """Handles data storage and retrieval for shark pups."""
-    
+    """Handles data storage and retrieval for shark pups.
+
+    Storage stays plain JSON arrays on purpose: the files are shipped
+    fixtures that other code (and users) read directly, and at colony
+    scale the mtime-cached parses plus in-memory indexes already serve
+    reads without touching disk. Moving to SQLite would buy C-level
+    aggregation at the cost of a migration and losing the hand-editable
+    data files; revisit only if collections outgrow a single parse.
+    """
+
     def __init__(self, data_file="shark_pups.json", feeding_file="feeding_records.json", 
                  training_file="training_records.json", feeding_sessions_file="feeding_sessions.json",
                  measurements_file="measurements.json"):
@@ -26,7 +57,227 @@ class DataManager:
         if not os.path.exists(self.measurements_file):
             with open(self.measurements_file, "w") as f:
                 json.dump([], f)
-    
+        # Parsed collections cached by file mtime, so repeated reads within
+        # (and across) requests don't reparse unchanged files
+        self._cache = {}
+        # Computed growth stats per pup, validated against the
+        # measurement file's mtime like the parse caches above
+        self._growth_cache = {}
+        # Highest existing ID per collection, so adds don't rescan the file
+        self._max_ids = {}
+        for path in (self.data_file, self.feeding_file, self.training_file,
+                     self.feeding_sessions_file, self.measurements_file):
+            self._max_ids[path] = self._scan_max_id(path)
+
+    def _parse_file(self, path):
+        """Parse a collection file into a list of dicts.
+
+        Files stay uncompressed JSON: zstd would shrink the bytes read,
+        but it breaks the in-place append splice and mmap parse, forces a
+        full decompress on every (already mtime-cached) read, and makes
+        the data files opaque to everything else that opens them.
+        """
+        if orjson is not None:
+            # Parse straight out of the page cache via mmap, skipping the
+            # intermediate Python bytes buffer. stdlib json can't consume
+            # a map without copying, so the fallback reads normally.
+            try:
+                with open(path, "rb") as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    view = memoryview(mm)
+                    try:
+                        return orjson.loads(view)
+                    finally:
+                        view.release()
+            except ValueError:
+                # Zero-length files can't be mapped
+                return []
+        # Slurp the whole file and decode in one shot; json.load's
+        # buffered incremental reads cost more syscalls for these sizes.
+        with open(path, "rb") as f:
+            return json.loads(f.read())
+
+    def _dump_record(self, record):
+        """Serialize one record dict with the fast encoder when available.
+
+        Output is compact — pretty-printing roughly doubles the bytes
+        written on every persistence call for no functional gain.
+        """
+        if orjson is not None:
+            return orjson.dumps(record).decode("utf-8")
+        return json.dumps(record, separators=(",", ":"))
+
+    def _save(self, path, record_dicts):
+        """Serialize a whole collection to bytes and write it in one call.
+
+        Encoding to one buffer first matters: json.dump's incremental
+        emitter pushes each token through the file object separately,
+        which is orders of magnitude more write calls for the same bytes.
+
+        Updates and deletes rewrite the file. Adds go through
+        _append_record instead, so only edits — the rare operation here —
+        pay O(file size); keeping the files plain JSON arrays rules out
+        the byte-offset/tombstone editing a log format would allow.
+
+        Untouched records reuse their memoized to_dict output, so the
+        rewrite re-encodes cached dicts in one C-level dumps call.
+        Caching raw JSON fragments per record and string-joining them
+        would skip that encode but fall back to Python-level joins —
+        slower in practice than handing orjson the whole list.
+        """
+        if orjson is not None:
+            payload = orjson.dumps(record_dicts)
+        else:
+            payload = json.dumps(record_dicts, separators=(",", ":")).encode("utf-8")
+        # Write to a sibling temp file and publish atomically, so a
+        # concurrent reader never sees a half-written array (os.replace
+        # also bumps the mtime exactly once, which the caches key on).
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+        self._invalidate(path)
+
+    def _load(self, path, cls):
+        """Load a collection file as model objects, cached on file mtime.
+
+        A streaming parser (ijson) could early-exit id lookups without
+        materializing the list, but it would pay a fresh O(n) parse on
+        every call; parsing once per mtime and serving lookups from the
+        indexes below is faster for every access pattern the routes have.
+        """
+        try:
+            mtime = os.stat(path).st_mtime_ns
+            cached = self._cache.get(path)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+            records = [cls.from_dict(d) for d in self._parse_file(path)]
+            # Secondary indexes so id lookups are O(1) and per-pup filters
+            # are O(matches) instead of full scans. Keys are stringified
+            # because callers pass ids as either int or str.
+            by_id = {}
+            by_pup = defaultdict(list)
+            for obj in records:
+                by_id[str(obj.id)] = obj
+                pup_id = getattr(obj, "pup_id", None)
+                if pup_id is not None:
+                    by_pup[str(pup_id)].append(obj)
+            self._cache[path] = (mtime, records, by_id, by_pup)
+            return records
+        except Exception as e:
+            logging.error(f"Error reading {path}: {e}")
+            return []
+
+    def _load_raw(self, path):
+        """Load a collection file as plain dicts, cached on file mtime.
+
+        The stats paths only read fields, so they skip the from_dict
+        model construction entirely.
+        """
+        key = (path, "raw")
+        try:
+            mtime = os.stat(path).st_mtime_ns
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+            records = self._parse_file(path)
+            self._cache[key] = (mtime, records)
+            return records
+        except Exception as e:
+            logging.error(f"Error reading {path}: {e}")
+            return []
+
+    def _load_raw_by_pup(self, path):
+        """Group a collection's raw dicts by pup, cached on file mtime.
+
+        Lets stats answer "no history for this pup" (the common case for
+        a newly added pup) without scanning the whole collection, and
+        serves per-pup filters in O(matches) instead of O(N) — mirroring
+        the model-object by_pup index in _load.
+        """
+        key = (path, "raw_by_pup")
+        try:
+            mtime = os.stat(path).st_mtime_ns
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+            by_pup = defaultdict(list)
+            for record in self._load_raw(path):
+                by_pup[str(record.get("pup_id"))].append(record)
+            self._cache[key] = (mtime, by_pup)
+            return by_pup
+        except Exception as e:
+            logging.error(f"Error reading {path}: {e}")
+            return {}
+
+    def _load_indexes(self, path, cls):
+        """Return the (id -> obj, pup_id -> [objs]) indexes for a collection."""
+        self._load(path, cls)
+        cached = self._cache.get(path)
+        if cached is None:
+            return {}, {}
+        return cached[2], cached[3]
+
+    def _invalidate(self, path):
+        """Drop the cached parses for a collection file after a write."""
+        self._cache.pop(path, None)
+        self._cache.pop((path, "raw"), None)
+        self._cache.pop((path, "raw_by_pup"), None)
+
+    def _scan_max_id(self, path):
+        """Find the highest record ID currently stored in a collection file.
+
+        Runs once per file at startup to seed _max_ids; adds then bump the
+        counter via _next_id instead of rescanning the whole collection.
+        """
+        try:
+            records = self._parse_file(path)
+            return max((int(r["id"]) for r in records if r.get("id") is not None), default=0)
+        except Exception as e:
+            logging.error(f"Error scanning max ID for {path}: {e}")
+            return 0
+
+    def _next_id(self, path):
+        """Reserve and return the next record ID for a collection file."""
+        self._max_ids[path] += 1
+        return self._max_ids[path]
+
+    def _append_record(self, path, record):
+        """Append one record to a JSON array file without rewriting it."""
+        self._append_records(path, [record])
+
+    def _append_records(self, path, records):
+        """Append records to a JSON array file without rewriting it.
+
+        Seeks back over the closing bracket and splices the new records in
+        with a single write, so an add costs O(records size) I/O instead
+        of O(file size) — and a batch of adds costs one syscall
+        round-trip, not one per record.
+        """
+        # Match the two-space indentation of records inside the array
+        fragment = ",\n".join(
+            "  " + self._dump_record(r).replace("\n", "\n  ") for r in records
+        )
+        with open(path, "rb+") as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            tail_len = min(size, 4096)
+            f.seek(size - tail_len)
+            tail = f.read(tail_len)
+            bracket = tail.rfind(b"]")
+            if bracket == -1:
+                raise ValueError(f"{path} does not end with a JSON array")
+            # Last content byte before the closing bracket
+            j = bracket - 1
+            while j >= 0 and tail[j:j + 1].isspace():
+                j -= 1
+            empty = j < 0 or tail[j:j + 1] == b"["
+            f.truncate(size - tail_len + j + 1)
+            f.seek(0, os.SEEK_END)
+            separator = "\n" if empty else ",\n"
+            f.write((separator + fragment + "\n]").encode("utf-8"))
+        self._invalidate(path)
+
     def ensure_data_file_exists(self):
         """Create the data file if it doesn't exist."""
         if not os.path.exists(self.data_file):
@@ -47,41 +298,83 @@ class DataManager:
     
     def get_all_pups(self):
         """Get all shark pups from the data file."""
-        try:
-            with open(self.data_file, "r") as f:
-                pup_dicts = json.load(f)
-                return [SharkPup.from_dict(pup_dict) for pup_dict in pup_dicts]
-        except Exception as e:
-            logging.error(f"Error reading shark pups data: {e}")
-            return []
-    
+        return self._load(self.data_file, SharkPup)
+
+    # Sort keys for get_pups_sorted, built once at class definition
+    # rather than per request. Keyed on (column, reverse); the inf
+    # sentinels keep None values last in either direction, mirroring
+    # ORDER BY ... NULLS LAST.
+    _PUP_SORT_KEYS = {
+        ("date", False): attrgetter("date"),
+        ("date", True): attrgetter("date"),
+        ("name", False): attrgetter("name"),
+        ("name", True): attrgetter("name"),
+        ("length", False): lambda p: float("inf") if p.length is None else p.length,
+        ("length", True): lambda p: float("-inf") if p.length is None else p.length,
+        ("weight", False): lambda p: float("inf") if p.weight is None else p.weight,
+        ("weight", True): lambda p: float("-inf") if p.weight is None else p.weight,
+    }
+
+    def get_pups_sorted(self, sort_by="date", order="desc"):
+        """Get all pups ordered by one column, with None values last.
+
+        The equivalent of ORDER BY ... NULLS LAST for the JSON backend:
+        one sorted() pass with a key looked up from the dispatch table
+        above, instead of branching and building closures per call.
+        """
+        pups = self._load(self.data_file, SharkPup)
+        reverse = order == "desc"
+        key = self._PUP_SORT_KEYS.get((sort_by, reverse),
+                                      self._PUP_SORT_KEYS[("date", reverse)])
+        return sorted(pups, key=key, reverse=reverse)
+
+    def get_live_pups(self):
+        """Get all pups whose status is 'live'.
+
+        status is always set (the model defaults it to 'live'), so this
+        is a plain filter over the cached list — callers don't need
+        per-pup getattr guards.
+        """
+        return [p for p in self._load(self.data_file, SharkPup) if p.status == "live"]
+
+
     def add_pup(self, pup):
         """Add a new shark pup to the data file."""
         try:
-            pups = self.get_all_pups()
-            
-            # Set ID to be one more than the highest existing ID, or 1 if no pups exist
-            max_id = max([p.id or 0 for p in pups], default=0) if pups else 0
-            pup.id = max_id + 1
-            
-            pup_dicts = [p.to_dict() for p in pups]
-            pup_dicts.append(pup.to_dict())
-            
-            with open(self.data_file, "w") as f:
-                json.dump(pup_dicts, f, indent=2)
-            
+            pup.id = self._next_id(self.data_file)
+            self._append_record(self.data_file, pup.to_dict())
             return pup
         except Exception as e:
             logging.error(f"Error adding shark pup: {e}")
             return None
             
+    def add_pups_batch(self, pups):
+        """Add many shark pups in one write (bulk ingest).
+
+        IDs come from the in-memory counter and every record is spliced
+        into the array by a single append write, so throughput is bounded
+        by the disk rather than per-record open/write/close overhead.
+        """
+        try:
+            if not pups:
+                return []
+            for pup in pups:
+                pup.id = self._next_id(self.data_file)
+            self._append_records(self.data_file, [p.to_dict() for p in pups])
+            return pups
+        except Exception as e:
+            logging.error(f"Error adding shark pups in batch: {e}")
+            return None
+
     def update_pup(self, pup_id, updated_data):
         """Update an existing shark pup record."""
         try:
             pups = self.get_all_pups()
-            updated = False
-            
-            for i, pup in enumerate(pups):
+            updated_pup = None
+
+            # Find the pup to update; mutating it in place updates the
+            # list entry too, so no remove/append shuffle is needed
+            for pup in pups:
                 if pup.id == pup_id:
                     # Update fields with new data
                     if 'date' in updated_data:
@@ -103,19 +396,13 @@ class DataManager:
                     if 'sex' in updated_data:
                         pup.sex = updated_data['sex'] if updated_data['sex'] != '' else None
                     
-                    pups[i] = pup
-                    updated = True
+                    pup._cached_dict = None  # fields changed; drop memoized dict
+                    updated_pup = pup
                     break
-            
-            if updated:
-                pup_dicts = [p.to_dict() for p in pups]
-                with open(self.data_file, "w") as f:
-                    json.dump(pup_dicts, f, indent=2)
-                # Find the updated pup to return it
-                for p in pups:
-                    if p.id == pup_id:
-                        return p
-                return None
+
+            if updated_pup is not None:
+                self._save(self.data_file, [p.to_dict() for p in pups])
+                return updated_pup
             else:
                 logging.error(f"Shark pup with ID {pup_id} not found for updating")
                 return None
@@ -126,51 +413,43 @@ class DataManager:
     
     def get_pup_by_id(self, pup_id):
         """Get a shark pup by ID."""
-        try:
-            pups = self.get_all_pups()
-            for pup in pups:
-                if str(pup.id) == str(pup_id):
-                    return pup
-            return None
-        except Exception as e:
-            logging.error(f"Error getting shark pup by ID: {e}")
-            return None
+        by_id, _ = self._load_indexes(self.data_file, SharkPup)
+        return by_id.get(str(pup_id))
     
+    def get_pup_with_details(self, pup_id):
+        """Fetch a pup and all of its related records in one call.
+
+        The JSON backend has no lazy relationships to trip over, but
+        resolving every collection here keeps the detail page at one
+        index lookup per relationship (and one parse per changed file)
+        instead of scattering five manager calls through the route.
+        """
+        pup = self.get_pup_by_id(pup_id)
+        if pup is None:
+            return None
+        return {
+            "pup": pup,
+            "feeding_records": self.get_feeding_records_by_pup_id(pup_id),
+            "feeding_sessions": self.get_feeding_sessions_by_pup_id(pup_id),
+            "training_records": self.get_training_records_by_pup_id(pup_id),
+            "measurements": self.get_measurements_by_pup_id(pup_id),
+        }
+
     # Feeding Records Methods
     def get_all_feeding_records(self):
         """Get all feeding records from the feeding file."""
-        try:
-            with open(self.feeding_file, "r") as f:
-                record_dicts = json.load(f)
-                return [FeedingRecord.from_dict(record) for record in record_dicts]
-        except Exception as e:
-            logging.error(f"Error reading feeding records data: {e}")
-            return []
+        return self._load(self.feeding_file, FeedingRecord)
     
     def get_feeding_records_by_pup_id(self, pup_id):
         """Get feeding records for a specific shark pup."""
-        try:
-            records = self.get_all_feeding_records()
-            return [r for r in records if r.pup_id == pup_id]
-        except Exception as e:
-            logging.error(f"Error getting feeding records for pup ID {pup_id}: {e}")
-            return []
+        _, by_pup = self._load_indexes(self.feeding_file, FeedingRecord)
+        return by_pup.get(str(pup_id), [])
     
     def add_feeding_record(self, record):
         """Add a new feeding record to the feeding file."""
         try:
-            records = self.get_all_feeding_records()
-            
-            # Set ID to be one more than the highest existing ID, or 1 if no records exist
-            max_id = max([r.id or 0 for r in records], default=0) if records else 0
-            record.id = max_id + 1
-            
-            record_dicts = [r.to_dict() for r in records]
-            record_dicts.append(record.to_dict())
-            
-            with open(self.feeding_file, "w") as f:
-                json.dump(record_dicts, f, indent=2)
-            
+            record.id = self._next_id(self.feeding_file)
+            self._append_record(self.feeding_file, record.to_dict())
             return record
         except Exception as e:
             logging.error(f"Error adding feeding record: {e}")
@@ -179,38 +458,18 @@ class DataManager:
     # Training Records Methods
     def get_all_training_records(self):
         """Get all training records from the training file."""
-        try:
-            with open(self.training_file, "r") as f:
-                record_dicts = json.load(f)
-                return [TrainingRecord.from_dict(record) for record in record_dicts]
-        except Exception as e:
-            logging.error(f"Error reading training records data: {e}")
-            return []
+        return self._load(self.training_file, TrainingRecord)
     
     def get_training_records_by_pup_id(self, pup_id):
         """Get training records for a specific shark pup."""
-        try:
-            records = self.get_all_training_records()
-            return [r for r in records if r.pup_id == pup_id]
-        except Exception as e:
-            logging.error(f"Error getting training records for pup ID {pup_id}: {e}")
-            return []
+        _, by_pup = self._load_indexes(self.training_file, TrainingRecord)
+        return by_pup.get(str(pup_id), [])
     
     def add_training_record(self, record):
         """Add a new training record to the training file."""
         try:
-            records = self.get_all_training_records()
-            
-            # Set ID to be one more than the highest existing ID, or 1 if no records exist
-            max_id = max([r.id or 0 for r in records], default=0) if records else 0
-            record.id = max_id + 1
-            
-            record_dicts = [r.to_dict() for r in records]
-            record_dicts.append(record.to_dict())
-            
-            with open(self.training_file, "w") as f:
-                json.dump(record_dicts, f, indent=2)
-            
+            record.id = self._next_id(self.training_file)
+            self._append_record(self.training_file, record.to_dict())
             return record
         except Exception as e:
             logging.error(f"Error adding training record: {e}")
@@ -218,29 +477,22 @@ class DataManager:
             
     def get_training_record_by_id(self, record_id):
         """Get a training record by ID."""
-        try:
-            records = self.get_all_training_records()
-            for record in records:
-                if record.id == record_id:
-                    return record
-            return None
-        except Exception as e:
-            logging.error(f"Error getting training record by ID: {e}")
-            return None
+        by_id, _ = self._load_indexes(self.training_file, TrainingRecord)
+        return by_id.get(str(record_id))
     
     def update_training_record(self, record_id, updated_data):
         """Update an existing training record."""
         try:
             records = self.get_all_training_records()
             record_to_update = None
-            
-            # Find the record to update
-            for i, record in enumerate(records):
+
+            # Find the record to update; mutating it in place updates the
+            # list entry too, so no remove/append shuffle is needed
+            for record in records:
                 if record.id == record_id:
                     record_to_update = record
-                    records.remove(record)
                     break
-                    
+
             if not record_to_update:
                 return None
                 
@@ -255,14 +507,10 @@ class DataManager:
                 record_to_update.progress = updated_data['progress']
             if 'notes' in updated_data:
                 record_to_update.notes = updated_data['notes']
-            
-            # Add updated record back to the list
-            records.append(record_to_update)
-            
+            record_to_update._cached_dict = None  # fields changed; drop memoized dict
+
             # Save records
-            record_dicts = [r.to_dict() for r in records]
-            with open(self.training_file, "w") as f:
-                json.dump(record_dicts, f, indent=2)
+            self._save(self.training_file, [r.to_dict() for r in records])
             
             return record_to_update
             
@@ -281,9 +529,7 @@ class DataManager:
             
             if len(records) < original_count:
                 # Save the updated list
-                record_dicts = [r.to_dict() for r in records]
-                with open(self.training_file, "w") as f:
-                    json.dump(record_dicts, f, indent=2)
+                self._save(self.training_file, [r.to_dict() for r in records])
                 return True
             
             return False
@@ -294,7 +540,7 @@ class DataManager:
     
     def calculate_statistics(self):
         """Calculate basic statistics about shark pups."""
-        pups = self.get_all_pups()
+        pups = self._load_raw(self.data_file)
         if not pups:
             return {
                 "count": 0,
@@ -309,62 +555,85 @@ class DataManager:
                 "mother_stats": {}
             }
         
-        # Filter out None values for calculations
-        lengths = [pup.length for pup in pups if pup.length is not None]
-        weights = [pup.weight for pup in pups if pup.weight is not None]
-        
-        # Count live and stillborn pups
-        live_pups = [pup for pup in pups if getattr(pup, 'status', 'live') == 'live']
-        stillborn_pups = [pup for pup in pups if getattr(pup, 'status', 'live') == 'stillborn']
-        
-        # Group by mother shark
+        # One pass over the pups updates every accumulator at once instead
+        # of a separate walk per statistic. Kept in pure Python: at colony
+        # sizes the object->array conversion a NumPy version needs would
+        # cost more than the vectorized reductions save.
+        length_count = weight_count = 0
+        length_sum = weight_sum = 0.0
+        min_length = max_length = min_weight = max_weight = None
+        live_count = stillborn_count = 0
         mother_stats = {}
+
         for pup in pups:
-            mother_id = getattr(pup, 'mother_id', 'Unknown')
-            if not mother_id:
-                mother_id = 'Unknown'
-                
-            if mother_id not in mother_stats:
-                mother_stats[mother_id] = {
+            length = pup.get("length")
+            if length is not None:
+                length_count += 1
+                length_sum += length
+                if min_length is None or length < min_length:
+                    min_length = length
+                if max_length is None or length > max_length:
+                    max_length = length
+
+            weight = pup.get("weight")
+            if weight is not None:
+                weight_count += 1
+                weight_sum += weight
+                if min_weight is None or weight < min_weight:
+                    min_weight = weight
+                if max_weight is None or weight > max_weight:
+                    max_weight = weight
+
+            # Bind status, mother and the mother's stats dict once per pup
+            # rather than re-looking them up per branch below
+            status = pup.get("status") or 'live'
+            mother_id = pup.get("mother_id") or 'Unknown'
+
+            mother = mother_stats.get(mother_id)
+            if mother is None:
+                mother = mother_stats[mother_id] = {
                     'total': 0,
                     'live': 0,
                     'stillborn': 0
                 }
-                
-            mother_stats[mother_id]['total'] += 1
-            
-            # Count live/stillborn by mother
-            if getattr(pup, 'status', 'live') == 'live':
-                mother_stats[mother_id]['live'] += 1
-            elif getattr(pup, 'status', 'live') == 'stillborn':
-                mother_stats[mother_id]['stillborn'] += 1
-        
+            mother['total'] += 1
+
+            if status == 'live':
+                live_count += 1
+                mother['live'] += 1
+            elif status == 'stillborn':
+                stillborn_count += 1
+                mother['stillborn'] += 1
+
         return {
             "count": len(pups),
-            "live_count": len(live_pups),
-            "stillborn_count": len(stillborn_pups),
-            "avg_length": sum(lengths) / len(lengths) if lengths else 0,
-            "avg_weight": sum(weights) / len(weights) if weights else 0,
-            "min_length": min(lengths) if lengths else 0,
-            "max_length": max(lengths) if lengths else 0,
-            "min_weight": min(weights) if weights else 0,
-            "max_weight": max(weights) if weights else 0,
+            "live_count": live_count,
+            "stillborn_count": stillborn_count,
+            "avg_length": length_sum / length_count if length_count else 0,
+            "avg_weight": weight_sum / weight_count if weight_count else 0,
+            "min_length": min_length if min_length is not None else 0,
+            "max_length": max_length if max_length is not None else 0,
+            "min_weight": min_weight if min_weight is not None else 0,
+            "max_weight": max_weight if max_weight is not None else 0,
             "mother_stats": mother_stats
         }
     
     def get_monthly_data(self):
         """Get data grouped by month for charting."""
-        pups = self.get_all_pups()
-        
+        pups = self._load_raw(self.data_file)
+
         # Initialize monthly data
         monthly_data = {}
-        
+
         for pup in pups:
             try:
-                # Parse the date and extract the year-month
-                date_obj = datetime.strptime(pup.date, "%Y-%m-%d")
-                month_key = f"{date_obj.year}-{date_obj.month:02d}"
-                
+                # Dates are stored as YYYY-MM-DD, so the year-month is just
+                # the first seven characters — no strptime state machine.
+                date = pup.get("date")
+                if not date or len(date) < 7:
+                    raise ValueError(f"invalid date: {date!r}")
+                month_key = date[:7]
+
                 # Initialize the month if it doesn't exist
                 if month_key not in monthly_data:
                     monthly_data[month_key] = {
@@ -372,13 +641,13 @@ class DataManager:
                         "total_length": 0,
                         "total_weight": 0
                     }
-                
+
                 # Update the month's data
                 monthly_data[month_key]["count"] += 1
-                monthly_data[month_key]["total_length"] += pup.length
-                monthly_data[month_key]["total_weight"] += pup.weight
+                monthly_data[month_key]["total_length"] += pup["length"]
+                monthly_data[month_key]["total_weight"] += pup["weight"]
             except Exception as e:
-                logging.error(f"Error processing pup date {pup.date}: {e}")
+                logging.error(f"Error processing pup date {pup.get('date')}: {e}")
         
         # Calculate averages and format for Chart.js
         labels = []
@@ -404,11 +673,11 @@ class DataManager:
     def get_feeding_statistics(self, pup_id=None):
         """Calculate statistics about feeding records."""
         # Use feeding sessions instead of old feeding records
+        sessions = self._load_raw(self.feeding_sessions_file)
         if pup_id:
-            sessions = self.get_feeding_sessions_by_pup_id(pup_id)
-        else:
-            sessions = self.get_all_feeding_sessions()
-        
+            wanted = str(pup_id)
+            sessions = [s for s in sessions if str(s.get("pup_id")) == wanted]
+
         if not sessions:
             return {
                 "total_records": 0,
@@ -422,32 +691,24 @@ class DataManager:
         
         # Calculate statistics
         amounts = []
-        food_type_amounts = {}
+        food_type_amounts = defaultdict(float)
         total_records = 0
-        
+
         # Process all sessions and food items
         for session in sessions:
-            for food_item in session.food_items:
+            for food_item in session.get("food_items", []):
                 # Add amount to list for overall statistics
-                amount = food_item.amount
+                amount = food_item["amount"]
                 amounts.append(amount)
                 total_records += 1
-                
+
                 # Track food type consumption
-                food_type = food_item.food_type
-                if food_type in food_type_amounts:
-                    food_type_amounts[food_type] += amount
-                else:
-                    food_type_amounts[food_type] = amount
-        
+                food_type_amounts[food_item["food_type"]] += amount
+
         # Find most common food type by amount
-        most_common_food = "None"
-        max_food_amount = 0
-        for food_type, amount in food_type_amounts.items():
-            if amount > max_food_amount:
-                max_food_amount = amount
-                most_common_food = food_type
-                
+        most_common_food = max(food_type_amounts, key=food_type_amounts.get,
+                               default="None")
+
         # Format food type data for chart
         food_type_chart_data = {
             "labels": list(food_type_amounts.keys()),
@@ -474,38 +735,18 @@ class DataManager:
     # Feeding Sessions Methods
     def get_all_feeding_sessions(self):
         """Get all feeding sessions from the feeding sessions file."""
-        try:
-            with open(self.feeding_sessions_file, "r") as f:
-                session_dicts = json.load(f)
-                return [FeedingSession.from_dict(session) for session in session_dicts]
-        except Exception as e:
-            logging.error(f"Error reading feeding sessions data: {e}")
-            return []
+        return self._load(self.feeding_sessions_file, FeedingSession)
     
     def get_feeding_sessions_by_pup_id(self, pup_id):
         """Get feeding sessions for a specific shark pup."""
-        try:
-            sessions = self.get_all_feeding_sessions()
-            return [s for s in sessions if s.pup_id == pup_id]
-        except Exception as e:
-            logging.error(f"Error getting feeding sessions for pup ID {pup_id}: {e}")
-            return []
+        _, by_pup = self._load_indexes(self.feeding_sessions_file, FeedingSession)
+        return by_pup.get(str(pup_id), [])
     
     def add_feeding_session(self, session):
         """Add a new feeding session to the feeding sessions file."""
         try:
-            sessions = self.get_all_feeding_sessions()
-            
-            # Set ID to be one more than the highest existing ID, or 1 if no sessions exist
-            max_id = max([s.id or 0 for s in sessions], default=0) if sessions else 0
-            session.id = max_id + 1
-            
-            session_dicts = [s.to_dict() for s in sessions]
-            session_dicts.append(session.to_dict())
-            
-            with open(self.feeding_sessions_file, "w") as f:
-                json.dump(session_dicts, f, indent=2)
-            
+            session.id = self._next_id(self.feeding_sessions_file)
+            self._append_record(self.feeding_sessions_file, session.to_dict())
             return session
         except Exception as e:
             logging.error(f"Error adding feeding session: {e}")
@@ -513,29 +754,22 @@ class DataManager:
     
     def get_feeding_session_by_id(self, session_id):
         """Get a feeding session by ID."""
-        try:
-            sessions = self.get_all_feeding_sessions()
-            for session in sessions:
-                if session.id == session_id:
-                    return session
-            return None
-        except Exception as e:
-            logging.error(f"Error getting feeding session by ID: {e}")
-            return None
+        by_id, _ = self._load_indexes(self.feeding_sessions_file, FeedingSession)
+        return by_id.get(str(session_id))
             
     def update_feeding_session(self, session_id, updated_data):
         """Update an existing feeding session."""
         try:
             sessions = self.get_all_feeding_sessions()
             session_to_update = None
-            
-            # Find the session to update
-            for i, session in enumerate(sessions):
+
+            # Find the session to update; mutating it in place updates the
+            # list entry too, so no remove/append shuffle is needed
+            for session in sessions:
                 if session.id == session_id:
                     session_to_update = session
-                    sessions.remove(session)
                     break
-                    
+
             if not session_to_update:
                 return None
                 
@@ -550,20 +784,17 @@ class DataManager:
             # Update food items if provided
             if 'food_items' in updated_data:
                 session_to_update.food_items = []
+                session_to_update._total_amount = 0.0  # rebuilt by add_food_item
                 for item_data in updated_data['food_items']:
                     session_to_update.add_food_item(
                         food_type=item_data['food_type'],
                         amount=item_data['amount'],
                         notes=item_data.get('notes', '')
                     )
-            
-            # Add updated session back to the list
-            sessions.append(session_to_update)
-            
+            session_to_update._cached_dict = None  # fields changed; drop memoized dict
+
             # Save sessions
-            session_dicts = [s.to_dict() for s in sessions]
-            with open(self.feeding_sessions_file, "w") as f:
-                json.dump(session_dicts, f, indent=2)
+            self._save(self.feeding_sessions_file, [s.to_dict() for s in sessions])
             
             return session_to_update
             
@@ -582,9 +813,7 @@ class DataManager:
             
             if len(sessions) < original_count:
                 # Save the updated list
-                session_dicts = [s.to_dict() for s in sessions]
-                with open(self.feeding_sessions_file, "w") as f:
-                    json.dump(session_dicts, f, indent=2)
+                self._save(self.feeding_sessions_file, [s.to_dict() for s in sessions])
                 return True
             
             return False
@@ -609,23 +838,18 @@ class DataManager:
             }
         
         # Calculate statistics
-        food_types = {}
+        food_types = defaultdict(lambda: {"count": 0, "amount": 0.0})
         total_amount = 0
         all_items_count = 0
-        
+
         for session in sessions:
             for food_item in session.food_items:
                 all_items_count += 1
                 total_amount += food_item.amount
-                
-                if food_item.food_type in food_types:
-                    food_types[food_item.food_type]["count"] += 1
-                    food_types[food_item.food_type]["amount"] += food_item.amount
-                else:
-                    food_types[food_item.food_type] = {
-                        "count": 1,
-                        "amount": food_item.amount
-                    }
+
+                ft = food_types[food_item.food_type]
+                ft["count"] += 1
+                ft["amount"] += food_item.amount
         
         food_type_data = [{
             "name": food_type,
@@ -644,11 +868,11 @@ class DataManager:
     
     def get_training_statistics(self, pup_id=None):
         """Calculate statistics about training records."""
+        records = self._load_raw(self.training_file)
         if pup_id:
-            records = self.get_training_records_by_pup_id(pup_id)
-        else:
-            records = self.get_all_training_records()
-        
+            wanted = str(pup_id)
+            records = [r for r in records if str(r.get("pup_id")) == wanted]
+
         if not records:
             return {
                 "count": 0,
@@ -658,22 +882,13 @@ class DataManager:
             }
         
         # Calculate statistics
-        training_types = {}
-        progress_breakdown = {}
-        durations = [record.duration for record in records]
-        
+        training_types = defaultdict(int)
+        progress_breakdown = defaultdict(int)
+        durations = [record["duration"] for record in records]
+
         for record in records:
-            # Count by training type
-            if record.training_type in training_types:
-                training_types[record.training_type] += 1
-            else:
-                training_types[record.training_type] = 1
-            
-            # Count by progress status
-            if record.progress in progress_breakdown:
-                progress_breakdown[record.progress] += 1
-            else:
-                progress_breakdown[record.progress] = 1
+            training_types[record["training_type"]] += 1
+            progress_breakdown[record["progress"]] += 1
         
         training_type_data = [{
             "name": training_type,
@@ -694,62 +909,50 @@ class DataManager:
         
     # Measurement Records Methods
     def get_all_measurements(self):
-        """Get all measurement records from the measurements file."""
-        try:
-            with open(self.measurements_file, "r") as f:
-                data = json.load(f)
-                measurements = []
-                for item in data:
-                    measurements.append(MeasurementRecord.from_dict(item))
-                return measurements
-        except (FileNotFoundError, json.JSONDecodeError):
-            return []
+        """Get all measurement records from the measurements file.
+
+        Served from the mtime-keyed cache in _load, so polling dashboards
+        only pay disk I/O and JSON decode when the file actually changed.
+        """
+        return self._load(self.measurements_file, MeasurementRecord)
             
     def get_measurements_by_pup_id(self, pup_id):
         """Get measurement records for a specific shark pup."""
-        all_measurements = self.get_all_measurements()
-        return [m for m in all_measurements if str(m.pup_id) == str(pup_id)]
+        _, by_pup = self._load_indexes(self.measurements_file, MeasurementRecord)
+        return by_pup.get(str(pup_id), [])
         
     def add_measurement(self, measurement):
         """Add a new measurement record to the measurements file."""
-        measurements = self.get_all_measurements()
-        
-        # Generate a unique ID if none exists
+        # Generate a unique ID if none exists. IDs are ints like every
+        # other collection; records stored as strings by older versions
+        # still resolve through the string-keyed indexes.
         if measurement.id is None:
-            # Find the highest existing ID and add 1
-            max_id = 0
-            for m in measurements:
-                if m.id and int(m.id) > max_id:
-                    max_id = int(m.id)
-            measurement.id = str(max_id + 1)
-        
-        measurements.append(measurement)
-        
-        with open(self.measurements_file, "w") as f:
-            json.dump([m.to_dict() for m in measurements], f, indent=2)
-        
+            measurement.id = self._next_id(self.measurements_file)
+
+        self._append_record(self.measurements_file, measurement.to_dict())
+
         return measurement
         
     def get_measurement_by_id(self, measurement_id):
         """Get a measurement record by ID."""
-        for measurement in self.get_all_measurements():
-            if measurement.id == measurement_id:
-                return measurement
-        return None
+        by_id, _ = self._load_indexes(self.measurements_file, MeasurementRecord)
+        return by_id.get(str(measurement_id))
         
     def update_measurement(self, measurement_id, updated_data):
         """Update an existing measurement record."""
         measurements = self.get_all_measurements()
-        
+        measurement_id = str(measurement_id)
+
         for i, measurement in enumerate(measurements):
-            if measurement.id == measurement_id:
+            if str(measurement.id) == measurement_id:
                 # Update the measurement with new data
                 for key, value in updated_data.items():
                     setattr(measurement, key, value)
-                
+                measurement._cached_dict = None  # fields changed; drop memoized dict
+
+
                 # Save all measurements back to file
-                with open(self.measurements_file, "w") as f:
-                    json.dump([m.to_dict() for m in measurements], f, indent=2)
+                self._save(self.measurements_file, [m.to_dict() for m in measurements])
                 
                 return measurement
                 
@@ -758,26 +961,56 @@ class DataManager:
     def delete_measurement(self, measurement_id):
         """Delete a measurement record."""
         measurements = self.get_all_measurements()
-        
-        for i, measurement in enumerate(measurements):
-            if measurement.id == measurement_id:
-                # Remove the measurement from the list
-                del measurements[i]
-                
-                # Save all measurements back to file
-                with open(self.measurements_file, "w") as f:
-                    json.dump([m.to_dict() for m in measurements], f, indent=2)
-                
-                return True
-                
-        return False
+        measurement_id = str(measurement_id)
+
+        # Single filtering pass instead of search + del (which shifts
+        # every element after the hit)
+        remaining = [m for m in measurements if str(m.id) != measurement_id]
+        if len(remaining) == len(measurements):
+            return False
+
+        # Save the remaining measurements back to file
+        self._save(self.measurements_file, [m.to_dict() for m in remaining])
+
+        return True
         
     def get_growth_statistics(self, pup_id=None):
-        """Calculate statistics about pup growth based on measurement records."""
-        measurements = self.get_all_measurements()
-        
+        """Calculate statistics about pup growth based on measurement records.
+
+        Results are memoized per pup against the measurement file's
+        mtime — the same freshness rule the parse caches use — so the
+        read-heavy measurements page recomputes only after a write.
+        """
+        key = str(pup_id) if pup_id else None
+        try:
+            mtime = os.stat(self.measurements_file).st_mtime_ns
+        except OSError:
+            mtime = None
+        cached = self._growth_cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        stats = self._compute_growth_statistics(pup_id)
+        if mtime is not None:
+            if len(self._growth_cache) >= 256:
+                self._growth_cache.clear()
+            self._growth_cache[key] = (mtime, stats)
+        return stats
+
+    def _compute_growth_statistics(self, pup_id=None):
+        """Single-pass growth stats over the raw measurement dicts.
+
+        Endpoint samples are found by tracking min/max dates during the
+        accumulation pass — sorting just to take [0] and [-1] would be
+        O(N log N) plus a copied list for nothing.
+        """
+        # Stats only read four fields, so work on the raw dicts and skip
+        # building a MeasurementRecord per row. The per-pup grouping also
+        # short-circuits pups with no history — an empty list falls
+        # straight through to the default stats below.
         if pup_id:
-            measurements = [m for m in measurements if m.pup_id == pup_id]
+            measurements = self._load_raw_by_pup(self.measurements_file).get(str(pup_id), [])
+        else:
+            measurements = self._load_raw(self.measurements_file)
         
         # Default structure with None values for all stats
         stats = {
@@ -798,66 +1031,73 @@ class DataManager:
         
         if not measurements:
             return stats
-        
+
         # Update total records
         stats["total_records"] = len(measurements)
-        
-        # Weight statistics
-        weights = [m.weight for m in measurements if m.weight is not None]
-        if weights:
-            stats["weight_stats"]["min"] = min(weights)
-            stats["weight_stats"]["max"] = max(weights)
-            stats["weight_stats"]["avg"] = sum(weights) / len(weights)
-            
-            # Calculate growth rates if there are multiple measurements
-            if len(weights) >= 2:
+
+        # One pass accumulates min/max/sum/count and the earliest/latest
+        # dated sample for both metrics at once — no intermediate lists
+        # and no sort (ISO dates compare chronologically as strings).
+        w_count = l_count = 0
+        w_sum = l_sum = 0.0
+        w_min = w_max = l_min = l_max = None
+        w_first_date = w_last_date = l_first_date = l_last_date = None
+        w_first = w_last = l_first = l_last = None
+
+        for m in measurements:
+            date = m["date"]
+            weight = m.get("weight")
+            if weight is not None:
+                w_count += 1
+                w_sum += weight
+                if w_min is None or weight < w_min:
+                    w_min = weight
+                if w_max is None or weight > w_max:
+                    w_max = weight
+                if w_first_date is None or date < w_first_date:
+                    w_first_date, w_first = date, weight
+                if w_last_date is None or date >= w_last_date:
+                    w_last_date, w_last = date, weight
+
+            length = m.get("length")
+            if length is not None:
+                l_count += 1
+                l_sum += length
+                if l_min is None or length < l_min:
+                    l_min = length
+                if l_max is None or length > l_max:
+                    l_max = length
+                if l_first_date is None or date < l_first_date:
+                    l_first_date, l_first = date, length
+                if l_last_date is None or date >= l_last_date:
+                    l_last_date, l_last = date, length
+
+        if w_count:
+            stats["weight_stats"]["min"] = w_min
+            stats["weight_stats"]["max"] = w_max
+            stats["weight_stats"]["avg"] = w_sum / w_count
+            if w_count >= 2:
                 try:
-                    # Sort measurements by date
-                    sorted_weight_measurements = sorted([m for m in measurements if m.weight is not None], 
-                                                      key=lambda x: x.date)
-                    
-                    # Calculate total weight growth and time span
-                    first_weight = sorted_weight_measurements[0].weight
-                    last_weight = sorted_weight_measurements[-1].weight
-                    
-                    first_date = datetime.strptime(sorted_weight_measurements[0].date, "%Y-%m-%d")
-                    last_date = datetime.strptime(sorted_weight_measurements[-1].date, "%Y-%m-%d")
-                    
-                    days_diff = (last_date - first_date).days
+                    days_diff = _days_between(w_first_date, w_last_date)
                     if days_diff > 0:
-                        weight_growth_rate = (last_weight - first_weight) / days_diff  # g per day
-                        stats["weight_stats"]["growth_rate"] = weight_growth_rate
-                except Exception as e:
+                        # g per day
+                        stats["weight_stats"]["growth_rate"] = (w_last - w_first) / days_diff
+                except Exception:
                     # Keep growth_rate as None if there's any error in calculation
                     pass
-        
-        # Length statistics
-        lengths = [m.length for m in measurements if m.length is not None]
-        if lengths:
-            stats["length_stats"]["min"] = min(lengths)
-            stats["length_stats"]["max"] = max(lengths)
-            stats["length_stats"]["avg"] = sum(lengths) / len(lengths)
-            
-            # Calculate growth rates if there are multiple measurements
-            if len(lengths) >= 2:
+
+        if l_count:
+            stats["length_stats"]["min"] = l_min
+            stats["length_stats"]["max"] = l_max
+            stats["length_stats"]["avg"] = l_sum / l_count
+            if l_count >= 2:
                 try:
-                    # Sort measurements by date
-                    sorted_length_measurements = sorted([m for m in measurements if m.length is not None], 
-                                                     key=lambda x: x.date)
-                    
-                    # Calculate total length growth and time span
-                    first_length = sorted_length_measurements[0].length
-                    last_length = sorted_length_measurements[-1].length
-                    
-                    first_date = datetime.strptime(sorted_length_measurements[0].date, "%Y-%m-%d")
-                    last_date = datetime.strptime(sorted_length_measurements[-1].date, "%Y-%m-%d")
-                    
-                    days_diff = (last_date - first_date).days
+                    days_diff = _days_between(l_first_date, l_last_date)
                     if days_diff > 0:
-                        length_growth_rate = (last_length - first_length) / days_diff  # cm per day
-                        stats["length_stats"]["growth_rate"] = length_growth_rate
-                except Exception as e:
+                        # cm per day
+                        stats["length_stats"]["growth_rate"] = (l_last - l_first) / days_diff
+                except Exception:
                     # Keep growth_rate as None if there's any error in calculation
                     pass
-        
+
         return stats